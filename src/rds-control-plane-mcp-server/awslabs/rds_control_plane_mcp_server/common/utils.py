@@ -14,8 +14,8 @@
 
 """General utility functions for the RDS Control Plane MCP Server."""
 
-import time
-import uuid
+import datetime
+import secrets
 from ..constants import (
     DEFAULT_PORT_AURORA,
     DEFAULT_PORT_AURORA_POSTGRESQL,
@@ -29,8 +29,10 @@ from ..constants import (
 )
 from ..context import RDSContext
 from botocore.client import BaseClient
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, TypeVar
 
 
 T = TypeVar('T', bound=object)
@@ -42,26 +44,38 @@ def handle_paginated_aws_api_call(
     operation_parameters: Dict[str, Any],
     format_function: Callable[[Any], T],
     result_key: str,
+    page_size: Optional[int] = None,
 ) -> List[T]:
     """Fetch all results using AWS API pagination.
 
+    Pages are chained by their continuation token, so they cannot be requested in
+    parallel. Instead the next page is fetched on a background thread while the
+    current page is being formatted.
+
     Args:
         client: Boto3 client to use for the API call
         paginator_name: Name of the paginator to use (e.g. 'describe_db_clusters')
         operation_parameters: Parameters to pass to the paginator
         format_function: Function to format each item in the result
         result_key: Key in the response that contains the list of items
+        page_size: Number of items to request per page, if not the service default
 
     Returns:
         List of formatted results
     """
-    results = []
+    results: List[T] = []
     paginator = client.get_paginator(paginator_name)
-    operation_parameters['PaginationConfig'] = RDSContext.get_pagination_config()
-    page_iterator = paginator.paginate(**operation_parameters)
-    for page in page_iterator:
-        for item in page.get(result_key, []):
-            results.append(format_function(item))
+    pagination_config = RDSContext.get_pagination_config()
+    if page_size is not None:
+        pagination_config = {**pagination_config, 'PageSize': page_size}
+    page_iterator = iter(
+        paginator.paginate(**operation_parameters, PaginationConfig=pagination_config)
+    )
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_page = executor.submit(next, page_iterator, None)
+        while (page := next_page.result()) is not None:
+            next_page = executor.submit(next, page_iterator, None)
+            results.extend(map(format_function, page.get(result_key, ())))
 
     return results
 
@@ -83,8 +97,17 @@ def format_aws_response(response: Dict[str, Any]) -> Dict[str, Any]:
     return convert_datetime_to_string(response)
 
 
+_DATETIME_TYPES = (datetime.datetime, datetime.date)
+
+# how to iterate (key, value) pairs of the container types found in AWS responses
+_CONTAINER_ITEMS = {dict: dict.items, list: enumerate}
+
+
 def convert_datetime_to_string(obj: Any) -> Any:
-    """Recursively convert datetime objects to ISO format strings.
+    """Convert datetime objects to ISO format strings.
+
+    Nested dicts and lists are walked iteratively and converted in place, so the
+    returned object is the same container that was passed in.
 
     Args:
         obj: Object to convert
@@ -92,14 +115,19 @@ def convert_datetime_to_string(obj: Any) -> Any:
     Returns:
         Object with datetime objects converted to strings
     """
-    import datetime
-
-    if isinstance(obj, datetime.datetime):
+    if isinstance(obj, _DATETIME_TYPES):
         return obj.isoformat()
-    elif isinstance(obj, dict):
-        return {k: convert_datetime_to_string(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_datetime_to_string(item) for item in obj]
+    if type(obj) not in _CONTAINER_ITEMS:
+        return obj
+
+    stack = [obj]
+    while stack:
+        container = stack.pop()
+        for key, value in _CONTAINER_ITEMS[type(container)](container):
+            if type(value) in _CONTAINER_ITEMS:
+                stack.append(value)
+            elif isinstance(value, _DATETIME_TYPES):
+                container[key] = value.isoformat()
     return obj
 
 
@@ -112,13 +140,17 @@ def add_mcp_tags(params: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Parameters with MCP tags added
     """
-    tags = params.get('Tags', [])
+    tags = params.setdefault('Tags', [])
     tags.append({'Key': 'mcp_server_version', 'Value': MCP_SERVER_VERSION})
     tags.append({'Key': 'created_by', 'Value': 'rds-control-plane-mcp-server'})
-    params['Tags'] = tags
     return params
 
 
+# operation verbs used to derive the risk level of operations missing from OPERATION_IMPACTS
+_CRITICAL_OPERATION_VERBS = frozenset({'delete'})
+_HIGH_RISK_OPERATION_VERBS = frozenset({'modify', 'stop', 'reboot', 'failover'})
+
+
 def get_operation_impact(operation: str) -> Dict[str, Any]:
     """Get detailed impact information for an operation.
 
@@ -128,8 +160,8 @@ def get_operation_impact(operation: str) -> Dict[str, Any]:
     Returns:
         Dictionary with impact details
     """
-    if operation in OPERATION_IMPACTS:
-        return OPERATION_IMPACTS[operation]
+    if (impact := OPERATION_IMPACTS.get(operation)) is not None:
+        return impact
 
     # default impact for unknown operations
     return {
@@ -150,13 +182,16 @@ def get_operation_risk_level(operation: str) -> str:
     Returns:
         Risk level (low, high, or critical)
     """
-    if operation in OPERATION_IMPACTS:
-        return OPERATION_IMPACTS[operation]['risk']
+    if (impact := OPERATION_IMPACTS.get(operation)) is not None:
+        return impact['risk']
 
-    # default risk levels based on operation type
-    if operation.startswith('delete_'):
+    # default risk levels based on operation type (the verb before the first underscore)
+    verb, separator, _ = operation.partition('_')
+    if not separator:
+        return 'low'
+    if verb in _CRITICAL_OPERATION_VERBS:
         return 'critical'
-    elif operation.startswith(('modify_', 'stop_', 'reboot_', 'failover_')):
+    elif verb in _HIGH_RISK_OPERATION_VERBS:
         return 'high'
     else:
         return 'low'
@@ -171,8 +206,6 @@ def validate_db_identifier(identifier: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    import re
-
     # AWS RDS identifier rules:
     # - 1-63 characters
     # - Begin with a letter
@@ -183,15 +216,50 @@ def validate_db_identifier(identifier: str) -> bool:
     if not identifier or len(identifier) > 63:
         return False
 
-    if not re.match(r'^[a-zA-Z][a-zA-Z0-9-]*$', identifier):
+    # isalpha/isalnum accept non-ASCII letters, so restrict to ASCII first
+    if not identifier.isascii() or not identifier[0].isalpha():
         return False
 
+    for c in identifier:
+        if not (c.isalnum() or c == '-'):
+            return False
+
     if '--' in identifier or identifier.endswith('-'):
         return False
 
     return True
 
 
+# default ports keyed by the exact engine names returned by the RDS API
+_ENGINE_PORT_EXACT = {
+    'aurora': DEFAULT_PORT_AURORA,
+    'aurora-mysql': DEFAULT_PORT_AURORA,
+    'aurora-postgresql': DEFAULT_PORT_AURORA_POSTGRESQL,
+    'postgres': DEFAULT_PORT_POSTGRESQL,
+    'mysql': DEFAULT_PORT_MYSQL,
+    'mariadb': DEFAULT_PORT_MARIADB,
+    'oracle-ee': DEFAULT_PORT_ORACLE,
+    'oracle-ee-cdb': DEFAULT_PORT_ORACLE,
+    'oracle-se2': DEFAULT_PORT_ORACLE,
+    'oracle-se2-cdb': DEFAULT_PORT_ORACLE,
+    'sqlserver-ee': DEFAULT_PORT_SQLSERVER,
+    'sqlserver-se': DEFAULT_PORT_SQLSERVER,
+    'sqlserver-ex': DEFAULT_PORT_SQLSERVER,
+    'sqlserver-web': DEFAULT_PORT_SQLSERVER,
+}
+
+# fallback substring matches, checked in order (more specific engines first)
+_ENGINE_PORT_SUBSTR = (
+    ('aurora-postgresql', DEFAULT_PORT_AURORA_POSTGRESQL),
+    ('aurora', DEFAULT_PORT_AURORA),
+    ('postgres', DEFAULT_PORT_POSTGRESQL),
+    ('mysql', DEFAULT_PORT_MYSQL),
+    ('mariadb', DEFAULT_PORT_MARIADB),
+    ('oracle', DEFAULT_PORT_ORACLE),
+    ('sqlserver', DEFAULT_PORT_SQLSERVER),
+)
+
+
 def get_engine_port(engine: str) -> int:
     """Get the default port for a database engine.
 
@@ -203,24 +271,33 @@ def get_engine_port(engine: str) -> int:
     """
     engine_lower = engine.lower()
 
-    if 'aurora-postgresql' in engine_lower:
-        return DEFAULT_PORT_AURORA_POSTGRESQL
-    elif 'aurora' in engine_lower:
-        return DEFAULT_PORT_AURORA
-    elif 'postgres' in engine_lower:
-        return DEFAULT_PORT_POSTGRESQL
-    elif 'mysql' in engine_lower:
-        return DEFAULT_PORT_MYSQL
-    elif 'mariadb' in engine_lower:
-        return DEFAULT_PORT_MARIADB
-    elif 'oracle' in engine_lower:
-        return DEFAULT_PORT_ORACLE
-    elif 'sqlserver' in engine_lower:
-        return DEFAULT_PORT_SQLSERVER
-    else:
-        # default to MySQL port if unknown engine
-        logger.warning(f'Unknown engine type: {engine}. Using default MySQL port.')
-        return DEFAULT_PORT_MYSQL
+    port = _ENGINE_PORT_EXACT.get(engine_lower)
+    if port is not None:
+        return port
+
+    for name, port in _ENGINE_PORT_SUBSTR:
+        if name in engine_lower:
+            return port
+
+    # default to MySQL port if unknown engine
+    logger.warning(f'Unknown engine type: {engine}. Using default MySQL port.')
+    return DEFAULT_PORT_MYSQL
+
+
+def format_tags(tag_list: Optional[Iterable[Mapping[str, Any]]]) -> Dict[str, str]:
+    """Convert an AWS TagList into a dictionary of tag keys and values.
+
+    Args:
+        tag_list: TagList from an AWS response, which may be missing or empty
+
+    Returns:
+        Dictionary of tags, skipping any entry without both a key and a value
+    """
+    return {
+        key: value
+        for tag in tag_list or ()
+        if (key := tag.get('Key')) is not None and (value := tag.get('Value')) is not None
+    }
 
 
 def format_cluster_info(cluster: Dict[str, Any]) -> Dict[str, Any]:
@@ -232,6 +309,11 @@ def format_cluster_info(cluster: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Formatted cluster information
     """
+    # tools usually pass an already converted response, so only convert a raw datetime here
+    created_time = cluster.get('ClusterCreateTime')
+    if isinstance(created_time, _DATETIME_TYPES):
+        created_time = created_time.isoformat()
+
     return {
         'cluster_id': cluster.get('DBClusterIdentifier'),
         'status': cluster.get('Status'),
@@ -243,7 +325,7 @@ def format_cluster_info(cluster: Dict[str, Any]) -> Dict[str, Any]:
         'backup_retention': cluster.get('BackupRetentionPeriod'),
         'preferred_backup_window': cluster.get('PreferredBackupWindow'),
         'preferred_maintenance_window': cluster.get('PreferredMaintenanceWindow'),
-        'created_time': convert_datetime_to_string(cluster.get('ClusterCreateTime')),
+        'created_time': created_time,
         'members': [
             {
                 'instance_id': member.get('DBInstanceIdentifier'),
@@ -256,9 +338,7 @@ def format_cluster_info(cluster: Dict[str, Any]) -> Dict[str, Any]:
             {'id': sg.get('VpcSecurityGroupId'), 'status': sg.get('Status')}
             for sg in cluster.get('VpcSecurityGroups', [])
         ],
-        'tags': {tag['Key']: tag['Value'] for tag in cluster.get('TagList', [])}
-        if cluster.get('TagList')
-        else {},
+        'tags': format_tags(cluster.get('TagList')),
     }
 
 
@@ -271,55 +351,118 @@ def format_instance_info(instance: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Formatted instance information
     """
+    get = instance.get
+
     # Handle potentially nested endpoint structure
     endpoint = {}
-    if instance.get('Endpoint'):
-        if isinstance(instance['Endpoint'], dict):
+    if raw_endpoint := get('Endpoint'):
+        if isinstance(raw_endpoint, dict):
             endpoint = {
-                'address': instance['Endpoint'].get('Address'),
-                'port': instance['Endpoint'].get('Port'),
-                'hosted_zone_id': instance['Endpoint'].get('HostedZoneId'),
+                'address': raw_endpoint.get('Address'),
+                'port': raw_endpoint.get('Port'),
+                'hosted_zone_id': raw_endpoint.get('HostedZoneId'),
             }
         else:
-            endpoint = {'address': instance.get('Endpoint')}
+            endpoint = {'address': raw_endpoint}
 
     return {
-        'instance_id': instance.get('DBInstanceIdentifier'),
-        'status': instance.get('DBInstanceStatus'),
-        'engine': instance.get('Engine'),
-        'engine_version': instance.get('EngineVersion'),
-        'instance_class': instance.get('DBInstanceClass'),
+        'instance_id': get('DBInstanceIdentifier'),
+        'status': get('DBInstanceStatus'),
+        'engine': get('Engine'),
+        'engine_version': get('EngineVersion'),
+        'instance_class': get('DBInstanceClass'),
         'endpoint': endpoint,
-        'availability_zone': instance.get('AvailabilityZone'),
-        'multi_az': instance.get('MultiAZ', False),
+        'availability_zone': get('AvailabilityZone'),
+        'multi_az': get('MultiAZ', False),
         'storage': {
-            'type': instance.get('StorageType'),
-            'allocated': instance.get('AllocatedStorage'),
-            'encrypted': instance.get('StorageEncrypted'),
+            'type': get('StorageType'),
+            'allocated': get('AllocatedStorage'),
+            'encrypted': get('StorageEncrypted'),
         },
-        'publicly_accessible': instance.get('PubliclyAccessible', False),
+        'publicly_accessible': get('PubliclyAccessible', False),
         'vpc_security_groups': [
             {'id': sg.get('VpcSecurityGroupId'), 'status': sg.get('Status')}
-            for sg in instance.get('VpcSecurityGroups', [])
+            for sg in get('VpcSecurityGroups', [])
         ],
-        'db_cluster': instance.get('DBClusterIdentifier'),
-        'preferred_backup_window': instance.get('PreferredBackupWindow'),
-        'preferred_maintenance_window': instance.get('PreferredMaintenanceWindow'),
-        'tags': {tag['Key']: tag['Value'] for tag in instance.get('TagList', [])}
-        if instance.get('TagList')
-        else {},
-        'resource_id': instance.get('DbiResourceId'),
+        'db_cluster': get('DBClusterIdentifier'),
+        'preferred_backup_window': get('PreferredBackupWindow'),
+        'preferred_maintenance_window': get('PreferredMaintenanceWindow'),
+        'tags': format_tags(get('TagList')),
+        'resource_id': get('DbiResourceId'),
     }
 
 
-# dictionary to store pending operations
-# key: confirmation_token, value: (operation_type, params, expiration_time)
-_pending_operations = {}
-
-
 # expiration time for pending operations (in seconds)
 EXPIRATION_TIME = 300  # 5 minutes
 
+# upper bound on the number of outstanding confirmation tokens
+MAX_PENDING_OPERATIONS = 10_000
+
+# cache of pending operations, expired entries are evicted lazily by the cache
+# key: confirmation_token, value: (operation_type, params)
+_pending_operations: TTLCache = TTLCache(maxsize=MAX_PENDING_OPERATIONS, ttl=EXPIRATION_TIME)
+
+
+# how long a listed set of instances is reused (in seconds)
+INSTANCE_LIST_CACHE_TTL = 15
+
+# cache of instance list results, keyed by client so a recreated connection never
+# reuses another session's results
+_instance_list_cache: TTLCache = TTLCache(maxsize=8, ttl=INSTANCE_LIST_CACHE_TTL)
+
+# bumped on every clear, so a fetch that overlaps a clear does not cache its outdated result
+_instance_list_generation = 0
+
+
+def get_cached_instance_list(client: BaseClient) -> Optional[Any]:
+    """Get the cached instance list for a client.
+
+    Args:
+        client: The RDS client the list was fetched with
+
+    Returns:
+        Optional[Any]: The cached instance list, or None if missing or expired
+    """
+    return _instance_list_cache.get(client)
+
+
+def get_instance_list_generation() -> int:
+    """Get the current instance list cache generation.
+
+    Capture it before fetching an instance list and pass it to cache_instance_list.
+
+    Returns:
+        int: The number of times the instance list cache has been cleared
+    """
+    return _instance_list_generation
+
+
+def cache_instance_list(client: BaseClient, instance_list: Any, generation: int) -> bool:
+    """Cache the instance list fetched with a client.
+
+    The list is not cached if the cache was cleared since the fetch started, as it may
+    predate the change that caused the clear.
+
+    Args:
+        client: The RDS client the list was fetched with
+        instance_list: The instance list to reuse until it expires
+        generation: The cache generation captured before the fetch started
+
+    Returns:
+        bool: True if the list was cached, False otherwise
+    """
+    if generation != _instance_list_generation:
+        return False
+    _instance_list_cache[client] = instance_list
+    return True
+
+
+def clear_instance_list_cache() -> None:
+    """Discard cached instance lists so the next read reflects recent changes."""
+    global _instance_list_generation
+    _instance_list_generation += 1
+    _instance_list_cache.clear()
+
 
 def generate_confirmation_token() -> str:
     """Generate a unique confirmation token.
@@ -327,7 +470,7 @@ def generate_confirmation_token() -> str:
     Returns:
         str: A unique confirmation token
     """
-    return str(uuid.uuid4())
+    return secrets.token_hex(16)
 
 
 def add_pending_operation(operation_type: str, params: Dict[str, Any]) -> str:
@@ -341,8 +484,7 @@ def add_pending_operation(operation_type: str, params: Dict[str, Any]) -> str:
         str: The confirmation token for the operation
     """
     token = generate_confirmation_token()
-    expiration_time = time.time() + EXPIRATION_TIME
-    _pending_operations[token] = (operation_type, params, expiration_time)
+    _pending_operations[token] = (operation_type, params)
     return token
 
 
@@ -353,12 +495,8 @@ def get_pending_operation(token: str) -> Optional[tuple]:
         token: The confirmation token
 
     Returns:
-        Optional[tuple]: The operation type, parameters, and expiration time, or None if not found
+        Optional[tuple]: The operation type and parameters, or None if not found or expired
     """
-    # clean up expired operations
-    cleanup_expired_operations()
-
-    # return the operation if it exists
     return _pending_operations.get(token)
 
 
@@ -371,19 +509,4 @@ def remove_pending_operation(token: str) -> bool:
     Returns:
         bool: True if the operation was removed, False otherwise
     """
-    if token in _pending_operations:
-        del _pending_operations[token]
-        return True
-    return False
-
-
-def cleanup_expired_operations() -> None:
-    """Clean up expired operations."""
-    current_time = time.time()
-    expired_tokens = [
-        token
-        for token, (_, _, expiration_time) in _pending_operations.items()
-        if expiration_time < current_time
-    ]
-    for token in expired_tokens:
-        del _pending_operations[token]
+    return _pending_operations.pop(token, None) is not None
@@ -49,6 +49,9 @@ ERROR_INVALID_PARAMS = 'Invalid parameters: {}. Please check the parameter value
 ERROR_RESOURCE_NOT_FOUND = 'Resource not found: {}. Please check that the resource exists and you have permission to access it.'
 ERROR_MISSING_CONFIRMATION = 'Missing confirmation for destructive operation. Please provide the confirmation parameter with the required value.'
 
+# Largest page size accepted by the RDS describe APIs (MaxRecords)
+DESCRIBE_PAGE_SIZE = 100
+
 # Default database ports
 DEFAULT_PORT_MYSQL = 3306
 DEFAULT_PORT_POSTGRESQL = 5432
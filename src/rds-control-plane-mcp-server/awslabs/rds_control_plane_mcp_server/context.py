@@ -18,8 +18,20 @@ import asyncio
 from .constants import ERROR_READONLY_MODE
 from loguru import logger
 from mcp.server.fastmcp import Context
-from mypy_boto3_rds.type_defs import PaginatorConfigTypeDef
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+
+def _build_pagination_config(max_items: int) -> Mapping[str, Any]:
+    """Build a read-only pagination config for the given item limit.
+
+    Args:
+        max_items: Maximum number of items returned from API responses
+
+    Returns:
+        A read-only pagination config
+    """
+    return MappingProxyType({'MaxItems': max_items})
 
 
 class RDSContext:
@@ -27,6 +39,7 @@ class RDSContext:
 
     _readonly = True
     _max_items = 100
+    _pagination_config = _build_pagination_config(_max_items)
 
     @classmethod
     def initialize(cls, readonly: bool = True, max_items: int = 100):
@@ -38,6 +51,7 @@ class RDSContext:
         """
         cls._readonly = readonly
         cls._max_items = max_items
+        cls._pagination_config = _build_pagination_config(max_items)
 
     @classmethod
     def readonly_mode(cls) -> bool:
@@ -58,15 +72,15 @@ class RDSContext:
         return cls._max_items
 
     @classmethod
-    def get_pagination_config(cls) -> PaginatorConfigTypeDef:
+    def get_pagination_config(cls) -> Mapping[str, Any]:
         """Get the pagination config needed for API responses.
 
+        The config is built once per initialize() call and shared as a read-only mapping.
+
         Returns:
             The pagination config needed for API responses
         """
-        return {
-            'MaxItems': cls._max_items,
-        }
+        return cls._pagination_config
 
     @classmethod
     def check_operation_allowed(cls, operation: str, ctx: Optional['Context'] = None) -> bool:
@@ -18,6 +18,7 @@ import asyncio
 from ...common.connection import RDSConnectionManager
 from ...common.decorator import handle_exceptions
 from ...common.server import mcp
+from ...common.utils import format_tags
 from datetime import datetime
 from loguru import logger
 from mypy_boto3_rds.type_defs import DBClusterTypeDef
@@ -54,6 +55,8 @@ Returns a JSON document containing detailed cluster information:
 - `resource_uri`: The full resource URI for this specific cluster
 """
 
+_CLUSTER_URI_PREFIX = 'aws-rds://db-cluster/'
+
 # Data Models
 
 
@@ -112,46 +115,40 @@ class Cluster(BaseModel):
         Returns:
             Formatted cluster information as a Cluster object with comprehensive details
         """
-        members = []
-        for member in cluster.get('DBClusterMembers', []):
-            members.append(
-                ClusterMember(
-                    instance_id=member.get('DBInstanceIdentifier', ''),
-                    is_writer=member.get('IsClusterWriter', False),
-                    status=member.get('DBClusterParameterGroupStatus'),
-                )
-            )
+        get = cluster.get
 
-        vpc_security_groups = []
-        for sg in cluster.get('VpcSecurityGroups', []):
-            vpc_security_groups.append(
-                {'id': sg.get('VpcSecurityGroupId', ''), 'status': sg.get('Status', '')}
+        members = [
+            ClusterMember.model_construct(
+                instance_id=member.get('DBInstanceIdentifier', ''),
+                is_writer=member.get('IsClusterWriter', False),
+                status=member.get('DBClusterParameterGroupStatus'),
             )
+            for member in get('DBClusterMembers', [])
+        ]
 
-        tags = {}
-        if cluster.get('TagList'):
-            for tag in cluster.get('TagList', []):
-                if 'Key' in tag and 'Value' in tag:
-                    tags[tag['Key']] = tag['Value']
+        vpc_security_groups = [
+            {'id': sg.get('VpcSecurityGroupId', ''), 'status': sg.get('Status', '')}
+            for sg in get('VpcSecurityGroups', [])
+        ]
 
-        cluster_id = cluster.get('DBClusterIdentifier', '')
+        cluster_id = get('DBClusterIdentifier', '')
 
-        return cls(
+        return cls.model_construct(
             cluster_id=cluster_id,
-            status=cluster.get('Status', ''),
-            engine=cluster.get('Engine', ''),
-            engine_version=cluster.get('EngineVersion'),
-            endpoint=cluster.get('Endpoint'),
-            reader_endpoint=cluster.get('ReaderEndpoint'),
-            multi_az=cluster.get('MultiAZ', False),
-            backup_retention=cluster.get('BackupRetentionPeriod', 0),
-            preferred_backup_window=cluster.get('PreferredBackupWindow'),
-            preferred_maintenance_window=cluster.get('PreferredMaintenanceWindow'),
-            created_time=cluster.get('ClusterCreateTime'),
+            status=get('Status', ''),
+            engine=get('Engine', ''),
+            engine_version=get('EngineVersion'),
+            endpoint=get('Endpoint'),
+            reader_endpoint=get('ReaderEndpoint'),
+            multi_az=get('MultiAZ', False),
+            backup_retention=get('BackupRetentionPeriod', 0),
+            preferred_backup_window=get('PreferredBackupWindow'),
+            preferred_maintenance_window=get('PreferredMaintenanceWindow'),
+            created_time=get('ClusterCreateTime'),
             members=members,
             vpc_security_groups=vpc_security_groups,
-            tags=tags,
-            resource_uri=f'aws-rds://db-cluster/{cluster_id}',
+            tags=format_tags(get('TagList')),
+            resource_uri=_CLUSTER_URI_PREFIX + cluster_id,
         )
 
 
@@ -14,10 +14,12 @@
 
 """Resource for listing available RDS DB Clusters."""
 
+import asyncio
 from ...common.connection import RDSConnectionManager
 from ...common.decorator import handle_exceptions
 from ...common.server import mcp
-from ...common.utils import handle_paginated_aws_api_call
+from ...common.utils import format_tags, handle_paginated_aws_api_call
+from ...constants import DESCRIBE_PAGE_SIZE
 from loguru import logger
 from mypy_boto3_rds.type_defs import DBClusterTypeDef
 from pydantic import BaseModel, Field
@@ -53,12 +55,6 @@ class ClusterSummary(BaseModel):
         Returns:
             ClusterSummary: Formatted cluster summary information containing essential cluster details
         """
-        tags = {}
-        if cluster.get('TagList'):
-            for tag in cluster.get('TagList', []):
-                if 'Key' in tag and 'Value' in tag:
-                    tags[tag['Key']] = tag['Value']
-
         return cls(
             cluster_id=cluster.get('DBClusterIdentifier', ''),
             db_cluster_arn=cluster.get('DBClusterArn'),
@@ -68,7 +64,7 @@ class ClusterSummary(BaseModel):
             engine_version=cluster.get('EngineVersion'),
             availability_zones=cluster.get('AvailabilityZones', []),
             multi_az=cluster.get('MultiAZ', False),
-            tag_list=tags,
+            tag_list=format_tags(cluster.get('TagList')),
         )
 
 
@@ -124,12 +120,14 @@ async def list_clusters() -> ClusterSummaryList:
     logger.info('Listing RDS clusters')
     rds_client = RDSConnectionManager.get_connection()
 
-    clusters = handle_paginated_aws_api_call(
+    clusters = await asyncio.to_thread(
+        handle_paginated_aws_api_call,
         client=rds_client,
         paginator_name='describe_db_clusters',
         operation_parameters={},
         format_function=ClusterSummary.from_DBClusterTypeDef,
         result_key='DBClusters',
+        page_size=DESCRIBE_PAGE_SIZE,
     )
 
     result = ClusterSummaryList(
@@ -19,7 +19,7 @@ from .get_instance_detail import get_instance_detail
 from .list_instances import list_instances
 from .list_performance_reports import list_performance_reports
 from .read_performance_report import read_performance_report
-from .list_db_logs import list_db_log_files
+from .list_db_logs import list_db_log_files, list_db_log_files_by_name
 
 __all__ = [
     'get_instance_detail',
@@ -27,4 +27,5 @@ __all__ = [
     'list_performance_reports',
     'read_performance_report',
     'list_db_log_files',
+    'list_db_log_files_by_name',
 ]
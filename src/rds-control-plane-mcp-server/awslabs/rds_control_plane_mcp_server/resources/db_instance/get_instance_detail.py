@@ -18,6 +18,7 @@ import asyncio
 from ...common.connection import RDSConnectionManager
 from ...common.decorator import handle_exceptions
 from ...common.server import mcp
+from ...common.utils import format_tags
 from loguru import logger
 from mypy_boto3_rds.type_defs import DBInstanceTypeDef
 from pydantic import BaseModel, Field
@@ -120,7 +121,9 @@ class Instance(BaseModel):
         """Format instance information into a detailed model with comprehensive information.
 
         Takes raw instance data from AWS and formats it into a structured Instance model
-        containing all relevant details about the RDS instance configuration.
+        containing all relevant details about the RDS instance configuration. The model and
+        its nested endpoint and storage models are built with ``model_construct``, skipping
+        validation of the typed boto3 response.
 
         Args:
             instance: Raw instance data from AWS
@@ -128,47 +131,42 @@ class Instance(BaseModel):
         Returns:
             Instance: Formatted instance information with comprehensive details
         """
-        endpoint = InstanceEndpoint(
-            address=instance.get('Endpoint', {}).get('Address'),
-            hosted_zone_id=instance.get('Endpoint', {}).get('HostedZoneId'),
-            port=instance.get('Endpoint', {}).get('Port'),
+        get = instance.get
+        raw_endpoint = get('Endpoint') or {}
+        endpoint = InstanceEndpoint.model_construct(
+            address=raw_endpoint.get('Address'),
+            hosted_zone_id=raw_endpoint.get('HostedZoneId'),
+            port=raw_endpoint.get('Port'),
         )
 
-        storage = InstanceStorage(
-            type=instance.get('StorageType'),
-            allocated=instance.get('AllocatedStorage'),
-            encrypted=instance.get('StorageEncrypted'),
+        storage = InstanceStorage.model_construct(
+            type=get('StorageType'),
+            allocated=get('AllocatedStorage'),
+            encrypted=get('StorageEncrypted'),
         )
 
-        vpc_security_groups = []
-        for sg in instance.get('VpcSecurityGroups', []):
-            vpc_security_groups.append(
-                {'id': sg.get('VpcSecurityGroupId', ''), 'status': sg.get('Status', '')}
-            )
-
-        tags = {}
-        if instance.get('TagList'):
-            for tag in instance.get('TagList', []):
-                if 'Key' in tag and 'Value' in tag:
-                    tags[tag['Key']] = tag['Value']
-
-        return cls(
-            instance_id=instance.get('DBInstanceIdentifier', ''),
-            status=instance.get('DBInstanceStatus', ''),
-            engine=instance.get('Engine', ''),
-            engine_version=instance.get('EngineVersion', ''),
-            instance_class=instance.get('DBInstanceClass', ''),
+        vpc_security_groups = [
+            {'id': sg.get('VpcSecurityGroupId', ''), 'status': sg.get('Status', '')}
+            for sg in get('VpcSecurityGroups') or ()
+        ]
+
+        return cls.model_construct(
+            instance_id=get('DBInstanceIdentifier', ''),
+            status=get('DBInstanceStatus', ''),
+            engine=get('Engine', ''),
+            engine_version=get('EngineVersion', ''),
+            instance_class=get('DBInstanceClass', ''),
             endpoint=endpoint,
-            availability_zone=instance.get('AvailabilityZone'),
-            multi_az=instance.get('MultiAZ', False),
+            availability_zone=get('AvailabilityZone'),
+            multi_az=get('MultiAZ', False),
             storage=storage,
-            preferred_backup_window=instance.get('PreferredBackupWindow'),
-            preferred_maintenance_window=instance.get('PreferredMaintenanceWindow'),
-            publicly_accessible=instance.get('PubliclyAccessible', False),
+            preferred_backup_window=get('PreferredBackupWindow'),
+            preferred_maintenance_window=get('PreferredMaintenanceWindow'),
+            publicly_accessible=get('PubliclyAccessible', False),
             vpc_security_groups=vpc_security_groups,
-            db_cluster=instance.get('DBClusterIdentifier'),
-            tags=tags,
-            dbi_resource_id=instance.get('DbiResourceId'),
+            db_cluster=get('DBClusterIdentifier'),
+            tags=format_tags(get('TagList')),
+            dbi_resource_id=get('DbiResourceId'),
             resource_uri=None,
         )
 
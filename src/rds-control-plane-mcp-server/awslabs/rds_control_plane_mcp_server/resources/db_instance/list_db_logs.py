@@ -14,6 +14,7 @@
 
 """Resource for listing availble RDS DB Log File."""
 
+import asyncio
 from ...common.connection import RDSConnectionManager
 from ...common.decorator import handle_exceptions
 from ...common.server import mcp
@@ -21,7 +22,12 @@ from ...common.utils import handle_paginated_aws_api_call
 from datetime import datetime
 from mypy_boto3_rds.type_defs import DescribeDBLogFilesResponseTypeDef
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
+from urllib.parse import quote, unquote
+
+
+# bound once since it is called for every log file returned by the API
+_FROMTIMESTAMP = datetime.fromtimestamp
 
 
 LIST_DB_LOG_FILES_RESOURCE_DESCRIPTION = """List all available NON-EMPTY log files for a specific Amazon RDS instance.
@@ -58,6 +64,26 @@ Example usage scenarios:
 """
 
 
+LIST_DB_LOG_FILES_BY_NAME_RESOURCE_DESCRIPTION = """List NON-EMPTY log files of a specific Amazon RDS instance whose name contains a string.
+
+<use_case>
+Use this resource instead of the full log file list when you only need one kind of log,
+for example `error`, `slowquery` or `audit`. The filtering is done by the RDS API, so
+instances with many log files return much faster.
+</use_case>
+
+<important_notes>
+1. You must provide a valid DB instance identifier and a file name substring
+2. The substring is matched against the full log file name (e.g. `postgresql.log.2024-01-01`)
+3. The substring is a single URI path segment: percent-encode `/`, spaces and other reserved characters (e.g. `error%2F`)
+4. Log files are only available for instances with logs enabled
+</important_notes>
+
+## Response structure
+Returns the same structure as the `aws-rds://db-instance/{db_instance_identifier}/log` resource.
+"""
+
+
 class DBLogFileSummary(BaseModel):
     """Database log file information.
 
@@ -91,9 +117,9 @@ class DBLogFileSummary(BaseModel):
         Returns:
             DBLogFileSummary: Model instance containing the log file information
         """
-        return cls(
+        return cls.model_construct(
             log_file_name=log_file.get('LogFileName', ''),
-            last_written=datetime.fromtimestamp(log_file.get('LastWritten', 0) / 1000),
+            last_written=_FROMTIMESTAMP(log_file.get('LastWritten', 0) / 1000),
             size=log_file.get('Size', 0),
         )
 
@@ -110,6 +136,37 @@ class DBLogFileList(BaseModel):
     resource_uri: str = Field(description='The resource URI for the DB log files')
 
 
+async def _describe_db_log_files(
+    db_instance_identifier: str, filename_contains: Optional[str] = None
+) -> List[DBLogFileSummary]:
+    """Fetch the non-empty log files of a DB instance, filtered on the AWS side.
+
+    Args:
+        db_instance_identifier: The identifier of the DB instance.
+        filename_contains: Only return log files whose name contains this string.
+
+    Returns:
+        List[DBLogFileSummary]: The matching log files
+    """
+    rds_client = RDSConnectionManager.get_connection()
+
+    params = {
+        'DBInstanceIdentifier': db_instance_identifier,
+        'FileSize': 1,
+    }
+    if filename_contains:
+        params['FilenameContains'] = filename_contains
+
+    return await asyncio.to_thread(
+        handle_paginated_aws_api_call,
+        client=rds_client,
+        paginator_name='describe_db_log_files',
+        operation_parameters=params,
+        format_function=DBLogFileSummary.from_DescribeDBLogFilesDetailsTypeDef,
+        result_key='DescribeDBLogFiles',
+    )
+
+
 @mcp.resource(
     uri='aws-rds://db-instance/{db_instance_identifier}/log',
     name='ListDBLogFiles',
@@ -128,25 +185,48 @@ async def list_db_log_files(
     Returns:
         DBLogFileList: A model containing a list of DBLogFileSummary objects
     """
-    rds_client = RDSConnectionManager.get_connection()
-
-    params = {
-        'DBInstanceIdentifier': db_instance_identifier,
-        'FileSize': 1,
-    }
+    log_files = await _describe_db_log_files(db_instance_identifier)
 
-    log_files = handle_paginated_aws_api_call(
-        client=rds_client,
-        paginator_name='describe_db_log_files',
-        operation_parameters=params,
-        format_function=DBLogFileSummary.from_DescribeDBLogFilesDetailsTypeDef,
-        result_key='DescribeDBLogFiles',
+    result = DBLogFileList(
+        log_files=log_files,
+        count=len(log_files),
+        resource_uri=f'aws-rds://db-instance/{db_instance_identifier}/log',
     )
 
+    return result
+
+
+@mcp.resource(
+    uri='aws-rds://db-instance/{db_instance_identifier}/log/{filename_contains}',
+    name='ListDBLogFilesByName',
+    mime_type='application/json',
+    description=LIST_DB_LOG_FILES_BY_NAME_RESOURCE_DESCRIPTION,
+)
+@handle_exceptions
+async def list_db_log_files_by_name(
+    db_instance_identifier: str = Field(..., description='The identifier for the DB instance'),
+    filename_contains: str = Field(
+        ..., description='Only list log files whose name contains this string'
+    ),
+) -> DBLogFileList:
+    """List the non-empty log files of the database whose name contains a string.
+
+    Args:
+        db_instance_identifier: The identifier of the DB instance.
+        filename_contains: The string the log file names must contain.
+
+    Returns:
+        DBLogFileList: A model containing a list of DBLogFileSummary objects
+    """
+    # the template parameter arrives percent-encoded, as it appears in the URI
+    filename_contains = unquote(filename_contains)
+    log_files = await _describe_db_log_files(db_instance_identifier, filename_contains)
+    encoded_filter = quote(filename_contains, safe='')
+
     result = DBLogFileList(
         log_files=log_files,
         count=len(log_files),
-        resource_uri='aws-rds://db-instance/{db_instance_identifier}/log',
+        resource_uri=f'aws-rds://db-instance/{db_instance_identifier}/log/{encoded_filter}',
     )
 
     return result
@@ -14,10 +14,19 @@
 
 """Resource for listing available RDS DB Instances."""
 
+import asyncio
 from ...common.connection import RDSConnectionManager
 from ...common.decorator import handle_exceptions
 from ...common.server import mcp
-from ...common.utils import handle_paginated_aws_api_call
+from ...common.utils import (
+    INSTANCE_LIST_CACHE_TTL,
+    cache_instance_list,
+    format_tags,
+    get_cached_instance_list,
+    get_instance_list_generation,
+    handle_paginated_aws_api_call,
+)
+from ...constants import DESCRIBE_PAGE_SIZE
 from loguru import logger
 from mypy_boto3_rds.type_defs import DBInstanceTypeDef
 from pydantic import BaseModel, Field
@@ -52,30 +61,28 @@ class InstanceSummary(BaseModel):
     def from_DBInstanceTypeDef(cls, instance: DBInstanceTypeDef) -> 'InstanceSummary':
         """Format instance information into a simplified model for list views.
 
+        The summary is built with ``model_construct``, as the typed boto3 response does
+        not need per-field validation.
+
         Args:
             instance: Raw instance data from AWS API response
 
         Returns:
             Formatted instance information as an InstanceSummary object
         """
-        tags = {}
-        if instance.get('TagList'):
-            for tag in instance.get('TagList', []):
-                if 'Key' in tag and 'Value' in tag:
-                    tags[tag['Key']] = tag['Value']
-
-        return cls(
-            instance_id=instance.get('DBInstanceIdentifier', ''),
-            dbi_resource_id=instance.get('DbiResourceId'),
-            status=instance.get('DBInstanceStatus', ''),
-            engine=instance.get('Engine', ''),
-            engine_version=instance.get('EngineVersion', ''),
-            instance_class=instance.get('DBInstanceClass', ''),
-            availability_zone=instance.get('AvailabilityZone'),
-            multi_az=instance.get('MultiAZ', False),
-            publicly_accessible=instance.get('PubliclyAccessible', False),
-            db_cluster=instance.get('DBClusterIdentifier'),
-            tag_list=tags,
+        get = instance.get
+        return cls.model_construct(
+            instance_id=get('DBInstanceIdentifier', ''),
+            dbi_resource_id=get('DbiResourceId'),
+            status=get('DBInstanceStatus', ''),
+            engine=get('Engine', ''),
+            engine_version=get('EngineVersion', ''),
+            instance_class=get('DBInstanceClass', ''),
+            availability_zone=get('AvailabilityZone'),
+            multi_az=get('MultiAZ', False),
+            publicly_accessible=get('PubliclyAccessible', False),
+            db_cluster=get('DBClusterIdentifier'),
+            tag_list=format_tags(get('TagList')),
             resource_uri=None,
         )
 
@@ -88,7 +95,7 @@ class InstanceSummaryList(BaseModel):
     resource_uri: str = Field(description='The resource URI for instances')
 
 
-LIST_INSTANCES_RESOURCE_DESCRIPTION = """List all available Amazon RDS instances in your account.
+LIST_INSTANCES_RESOURCE_DESCRIPTION = f"""List all available Amazon RDS instances in your account.
 
 <use_case>
 Use this resource to discover all available RDS database instances in your AWS account.
@@ -99,7 +106,8 @@ Use this resource to discover all available RDS database instances in your AWS a
 2. Instance identifiers returned can be used with other tools and resources in this MCP server
 3. Keep note of the instance_id and dbi_resource_id for use with other tools
 4. Instances are filtered to the AWS region specified in your environment configuration
-5. Use the `aws-rds://db-instance/{instance_id}` to get more information about a specific instance
+5. Use the `aws-rds://db-instance/{{instance_id}}` to get more information about a specific instance
+6. The list is cached for up to {INSTANCE_LIST_CACHE_TTL} seconds, so changes made outside this server may take that long to appear
 </important_notes>
 
 ## Response structure
@@ -145,16 +153,23 @@ async def list_instances() -> InstanceSummaryList:
     logger.info('Getting instance list resource')
     rds_client = RDSConnectionManager.get_connection()
 
-    instances = handle_paginated_aws_api_call(
+    if (cached := get_cached_instance_list(rds_client)) is not None:
+        return cached
+
+    generation = get_instance_list_generation()
+    instances = await asyncio.to_thread(
+        handle_paginated_aws_api_call,
         client=rds_client,
         paginator_name='describe_db_instances',
         operation_parameters={},
         format_function=InstanceSummary.from_DBInstanceTypeDef,
         result_key='DBInstances',
+        page_size=DESCRIBE_PAGE_SIZE,
     )
 
     result = InstanceSummaryList(
         instances=instances, count=len(instances), resource_uri='aws-rds://db-instance'
     )
+    cache_instance_list(rds_client, result, generation)
 
     return result
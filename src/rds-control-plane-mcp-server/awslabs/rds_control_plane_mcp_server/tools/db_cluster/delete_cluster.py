@@ -20,6 +20,7 @@ from ...common.decorator import handle_exceptions
 from ...common.server import mcp
 from ...common.utils import (
     add_pending_operation,
+    clear_instance_list_cache,
     format_aws_response,
     format_cluster_info,
     get_operation_impact,
@@ -176,7 +177,7 @@ This operation cannot be undone.
         }
 
     # extract operation details
-    op_type, params, _ = pending_op
+    op_type, params = pending_op
 
     # verify that this is the correct operation type
     if op_type != 'delete_db_cluster':
@@ -202,6 +203,7 @@ This operation cannot be undone.
 
     logger.info(f'Deleting DB cluster {db_cluster_identifier}')
     response = await asyncio.to_thread(rds_client.delete_db_cluster, **aws_params)
+    clear_instance_list_cache()
     logger.success(f'Successfully initiated deletion of DB cluster {db_cluster_identifier}')
 
     result = format_aws_response(response)
@@ -19,6 +19,7 @@ from ...common.connection import RDSConnectionManager
 from ...common.decorator import handle_exceptions
 from ...common.server import mcp
 from ...common.utils import (
+    clear_instance_list_cache,
     format_aws_response,
     format_cluster_info,
     get_operation_impact,
@@ -151,6 +152,7 @@ async def failover_db_cluster(
 
     logger.info(f'Initiating failover for DB cluster {db_cluster_identifier}')
     response = await asyncio.to_thread(rds_client.failover_db_cluster, **params)
+    clear_instance_list_cache()
     logger.success(f'Successfully initiated failover for DB cluster {db_cluster_identifier}')
 
     result = format_aws_response(response)
@@ -19,6 +19,7 @@ from ...common.connection import RDSConnectionManager
 from ...common.decorator import handle_exceptions
 from ...common.server import mcp
 from ...common.utils import (
+    clear_instance_list_cache,
     format_aws_response,
     format_cluster_info,
 )
@@ -162,6 +163,7 @@ async def modify_db_cluster(
 
     logger.info(f'Modifying DB cluster {db_cluster_identifier}')
     response = await asyncio.to_thread(rds_client.modify_db_cluster, **params)
+    clear_instance_list_cache()
     logger.success(f'Successfully modified DB cluster {db_cluster_identifier}')
 
     result = format_aws_response(response)
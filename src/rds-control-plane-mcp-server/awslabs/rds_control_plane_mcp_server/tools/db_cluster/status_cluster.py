@@ -19,6 +19,7 @@ from ...common.connection import RDSConnectionManager
 from ...common.decorator import handle_exceptions
 from ...common.server import mcp
 from ...common.utils import (
+    clear_instance_list_cache,
     format_aws_response,
     format_cluster_info,
     get_operation_impact,
@@ -202,6 +203,8 @@ async def status_db_cluster(
         result = format_aws_response(response)
         result['message'] = SUCCESS_REBOOTED.format(f'DB cluster {db_cluster_identifier}')
 
+    clear_instance_list_cache()
+
     # add formatted cluster info to the result
     result['formatted_cluster'] = format_cluster_info(result.get('DBCluster', {}))
 
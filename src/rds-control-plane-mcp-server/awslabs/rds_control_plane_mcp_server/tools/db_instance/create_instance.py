@@ -20,6 +20,7 @@ from ...common.decorator import handle_exceptions
 from ...common.server import mcp
 from ...common.utils import (
     add_mcp_tags,
+    clear_instance_list_cache,
     format_aws_response,
     format_instance_info,
     get_engine_port,
@@ -274,6 +275,7 @@ async def create_db_instance(
 
     logger.info(f'Creating DB instance {db_instance_identifier} with engine {engine}')
     response = await asyncio.to_thread(rds_client.create_db_instance, **params)
+    clear_instance_list_cache()
     logger.success(f'Successfully created DB instance {db_instance_identifier}')
 
     result = format_aws_response(response)
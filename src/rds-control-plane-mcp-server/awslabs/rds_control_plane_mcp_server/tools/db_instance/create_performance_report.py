@@ -14,12 +14,14 @@
 
 """Performance report creation tool for RDS instances."""
 
+import asyncio
 from ...common.connection import PIConnectionManager
 from ...common.decorator import handle_exceptions
 from ...common.server import mcp
 from ...common.utils import add_mcp_tags
 from ...context import RDSContext
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from loguru import logger
 from pydantic import Field
 from typing import Optional, Tuple
@@ -31,6 +33,11 @@ MAX_DURATION_DAYS = 6
 DEFAULT_START_DAYS_AGO = 5
 DEFAULT_END_DAYS_AGO = 2
 
+MIN_DURATION = timedelta(minutes=MIN_DURATION_MINUTES)
+MAX_DURATION = timedelta(days=MAX_DURATION_DAYS)
+DEFAULT_START_OFFSET = timedelta(days=DEFAULT_START_DAYS_AGO)
+DEFAULT_END_OFFSET = timedelta(days=DEFAULT_END_DAYS_AGO)
+
 REPORT_CREATION_SUCCESS_RESPONSE = """Performance analysis report creation has been initiated successfully.
 
 The report ID is: {}
@@ -41,6 +48,9 @@ you can access the report details using the Performance Insights dashboard or th
 Note: Report generation typically takes a few minutes depending on the time range selected.
 """
 
+# the template is fixed, so split it around its two placeholders once at import time
+_REPORT_PREFIX, _REPORT_MIDDLE, _REPORT_SUFFIX = REPORT_CREATION_SUCCESS_RESPONSE.split('{}')
+
 CREATE_PERF_REPORT_TOOL_DESCRIPTION = """Create a performance report for an RDS instance.
 
     This tool creates a performance analysis report for a specific RDS instance over a time period
@@ -86,18 +96,25 @@ CREATE_PERF_REPORT_TOOL_DESCRIPTION = """Create a performance report for an RDS
 """
 
 
+@lru_cache(maxsize=64)
 def _parse_iso_datetime(time_str: str) -> datetime:
     """Parse ISO8601 datetime string, handling Z suffix.
 
+    Strings without an offset are taken to be UTC. Results are cached, as retried
+    requests tend to repeat the same time strings.
+
     Args:
         time_str: ISO8601 formatted datetime string
 
     Returns:
-        datetime: Parsed datetime object
+        datetime: Parsed timezone-aware datetime object
     """
     if time_str.endswith('Z'):
-        time_str = time_str.replace('Z', '+00:00')
-    return datetime.fromisoformat(time_str)
+        time_str = time_str[:-1] + '+00:00'
+    parsed = datetime.fromisoformat(time_str)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed
 
 
 def _get_default_time_range() -> Tuple[datetime, datetime]:
@@ -106,10 +123,8 @@ def _get_default_time_range() -> Tuple[datetime, datetime]:
     Returns:
         Tuple[datetime, datetime]: Default start and end times based on configured defaults
     """
-    now = datetime.now()
-    start = now - timedelta(days=DEFAULT_START_DAYS_AGO)
-    end = now - timedelta(days=DEFAULT_END_DAYS_AGO)
-    return start, end
+    now = datetime.now(timezone.utc)
+    return now - DEFAULT_START_OFFSET, now - DEFAULT_END_OFFSET
 
 
 def _parse_time_parameters(
@@ -162,9 +177,9 @@ def _validate_time_range(start: datetime, end: datetime) -> None:
         raise ValueError('start_time must be before end_time')
 
     duration = end - start
-    if duration < timedelta(minutes=MIN_DURATION_MINUTES):
+    if duration < MIN_DURATION:
         raise ValueError(f'Time range must be at least {MIN_DURATION_MINUTES} minutes')
-    if duration > timedelta(days=MAX_DURATION_DAYS):
+    if duration > MAX_DURATION:
         raise ValueError(f'Time range cannot exceed {MAX_DURATION_DAYS} days')
 
 
@@ -216,10 +231,12 @@ async def create_performance_report(
     params = add_mcp_tags(params)
 
     pi_client = PIConnectionManager.get_connection()
-    response = pi_client.create_performance_analysis_report(**params)
+    response = await asyncio.to_thread(pi_client.create_performance_analysis_report, **params)
 
     report_id = response.get('AnalysisReportId')
     if not report_id:
         raise ValueError('Failed to create performance report: No report ID returned')
 
-    return REPORT_CREATION_SUCCESS_RESPONSE.format(report_id, dbi_resource_identifier)
+    return ''.join(
+        (_REPORT_PREFIX, report_id, _REPORT_MIDDLE, dbi_resource_identifier, _REPORT_SUFFIX)
+    )
@@ -20,6 +20,7 @@ from ...common.decorator import handle_exceptions
 from ...common.server import mcp
 from ...common.utils import (
     add_pending_operation,
+    clear_instance_list_cache,
     format_aws_response,
     format_instance_info,
     get_operation_impact,
@@ -131,7 +132,7 @@ async def delete_db_instance(
         }
 
     # extract operation details
-    op_type, params, _ = pending_op
+    op_type, params = pending_op
 
     # verify that this is the correct operation type
     if op_type != 'delete_db_instance':
@@ -159,6 +160,7 @@ async def delete_db_instance(
 
     logger.info(f'Deleting DB instance {db_instance_identifier}')
     response = await asyncio.to_thread(rds_client.delete_db_instance, **aws_params)
+    clear_instance_list_cache()
     logger.success(f'Successfully initiated deletion of DB instance {db_instance_identifier}')
 
     result = format_aws_response(response)
@@ -19,6 +19,7 @@ from ...common.connection import RDSConnectionManager
 from ...common.decorator import handle_exceptions
 from ...common.server import mcp
 from ...common.utils import (
+    clear_instance_list_cache,
     format_aws_response,
     format_instance_info,
 )
@@ -198,6 +199,7 @@ async def modify_db_instance(
 
     logger.info(f'Modifying DB instance {db_instance_identifier}')
     response = await asyncio.to_thread(rds_client.modify_db_instance, **params)
+    clear_instance_list_cache()
     logger.success(f'Successfully modified DB instance {db_instance_identifier}')
 
     result = format_aws_response(response)
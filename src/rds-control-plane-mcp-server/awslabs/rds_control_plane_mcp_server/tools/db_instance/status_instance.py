@@ -19,6 +19,7 @@ from ...common.connection import RDSConnectionManager
 from ...common.decorator import handle_exceptions
 from ...common.server import mcp
 from ...common.utils import (
+    clear_instance_list_cache,
     format_aws_response,
     format_instance_info,
     get_operation_impact,
@@ -173,6 +174,8 @@ async def status_db_instance(
         result = format_aws_response(response)
         result['message'] = SUCCESS_REBOOTED.format(f'DB instance {db_instance_identifier}')
 
+    clear_instance_list_cache()
+
     # add formatted instance info to the result
     result['formatted_instance'] = format_instance_info(result.get('DBInstance', {}))
 
@@ -18,7 +18,6 @@ from ...common.connection import CloudwatchConnectionManager
 from ...common.decorator import handle_exceptions
 from ...common.server import mcp
 from ...common.utils import handle_paginated_aws_api_call
-from ...context import RDSContext
 from datetime import datetime
 from mcp.types import ToolAnnotations
 from mypy_boto3_cloudwatch.literals import StatusCodeType
@@ -273,7 +272,6 @@ def describe_rds_performance_metrics(
             'StartTime': start,
             'EndTime': end,
             'ScanBy': scan_by,
-            'PaginationConfig': RDSContext.get_pagination_config(),
         },
         format_function=MetricSummary.from_metric_data,
         result_key='MetricDataResults',
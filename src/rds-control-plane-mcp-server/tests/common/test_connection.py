@@ -205,3 +205,19 @@ def test_close_connection():
     # Verify client was closed
     mock_client.close.assert_called_once()
     assert RDSConnectionManager._client is None
+
+
+@patch('boto3.Session')
+def test_connection_manager_pool_config(mock_session, monkeypatch):
+    """Test that the shared client keeps a sized, keep-alive connection pool."""
+    PIConnectionManager._client = None
+    monkeypatch.setenv('PI_MAX_POOL_CONNECTIONS', '25')
+
+    try:
+        PIConnectionManager.get_connection()
+
+        config = mock_session.return_value.client.call_args.kwargs['config']
+        assert config.max_pool_connections == 25
+        assert config.tcp_keepalive is True
+    finally:
+        PIConnectionManager._client = None
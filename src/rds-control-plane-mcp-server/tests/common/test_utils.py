@@ -0,0 +1,390 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the common utils module in the RDS Control Plane MCP Server."""
+
+import datetime
+import pytest
+from awslabs.rds_control_plane_mcp_server.common import utils
+from awslabs.rds_control_plane_mcp_server.constants import OPERATION_IMPACTS
+from awslabs.rds_control_plane_mcp_server.context import RDSContext
+from cachetools import TTLCache
+from unittest.mock import MagicMock
+
+
+@pytest.mark.parametrize(
+    'identifier',
+    ['a', 'test-db', 'TestDB1', 'db-1-2-3', 'a' * 63],
+)
+def test_validate_db_identifier_valid(identifier):
+    """Test that well-formed identifiers are accepted."""
+    assert utils.validate_db_identifier(identifier) is True
+
+
+@pytest.mark.parametrize(
+    'identifier',
+    ['', '1db', '-db', 'db--1', 'db-', 'db_1', 'db.1', 'a' * 64],
+)
+def test_validate_db_identifier_invalid(identifier):
+    """Test that malformed identifiers are rejected."""
+    assert utils.validate_db_identifier(identifier) is False
+
+
+def test_validate_db_identifier_rejects_non_ascii():
+    """Test that non-ASCII letters are rejected even though str.isalpha accepts them."""
+    assert utils.validate_db_identifier('dé-1') is False
+    assert utils.validate_db_identifier('ádb') is False
+
+
+@pytest.mark.parametrize(
+    'engine,expected',
+    [
+        ('aurora-postgresql', 5432),
+        ('aurora-mysql', 3306),
+        ('postgres', 5432),
+        ('MySQL', 3306),
+        ('mariadb', 3306),
+        ('oracle-ee', 1521),
+        ('custom-oracle-ee', 1521),
+        ('sqlserver-ex', 1433),
+        ('custom-sqlserver-web', 1433),
+        ('unknown-engine', 3306),
+    ],
+)
+def test_get_engine_port(engine, expected):
+    """Test default port resolution for exact and partial engine names."""
+    assert utils.get_engine_port(engine) == expected
+
+
+class FakeTimer:
+    """Manually advanced clock for the pending operation cache."""
+
+    def __init__(self):
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current fake time."""
+        return self.now
+
+
+@pytest.fixture
+def pending_operations_timer(monkeypatch):
+    """Replace the pending operation cache with one driven by a fake clock."""
+    timer = FakeTimer()
+    monkeypatch.setattr(
+        utils,
+        '_pending_operations',
+        TTLCache(maxsize=utils.MAX_PENDING_OPERATIONS, ttl=utils.EXPIRATION_TIME, timer=timer),
+    )
+    return timer
+
+
+def test_pending_operation_roundtrip(pending_operations_timer):
+    """Test adding, fetching and removing a pending operation."""
+    token = utils.add_pending_operation('delete_db_cluster', {'DBClusterIdentifier': 'c1'})
+
+    pending_op = utils.get_pending_operation(token)
+    assert pending_op is not None
+    assert pending_op[0] == 'delete_db_cluster'
+    assert pending_op[1] == {'DBClusterIdentifier': 'c1'}
+    assert len(pending_op) == 2
+
+    assert utils.remove_pending_operation(token) is True
+    assert utils.get_pending_operation(token) is None
+    assert utils.remove_pending_operation(token) is False
+
+
+def test_pending_operation_expires(pending_operations_timer):
+    """Test that pending operations are no longer returned once they expire."""
+    expired = utils.add_pending_operation('delete_db_instance', {})
+    pending_operations_timer.now = 100.0
+    active = utils.add_pending_operation('delete_db_instance', {})
+
+    pending_operations_timer.now = utils.EXPIRATION_TIME + 1
+
+    assert utils.get_pending_operation(expired) is None
+    assert utils.remove_pending_operation(expired) is False
+    assert utils.get_pending_operation(active) is not None
+
+
+def test_pending_operations_are_bounded(pending_operations_timer, monkeypatch):
+    """Test that the number of outstanding tokens is capped."""
+    monkeypatch.setattr(
+        utils,
+        '_pending_operations',
+        TTLCache(maxsize=2, ttl=utils.EXPIRATION_TIME, timer=pending_operations_timer),
+    )
+
+    first = utils.add_pending_operation('delete_db_instance', {})
+    utils.add_pending_operation('delete_db_instance', {})
+    utils.add_pending_operation('delete_db_instance', {})
+
+    assert len(utils._pending_operations) == 2
+    assert utils.get_pending_operation(first) is None
+
+
+@pytest.fixture
+def instance_list_cache_timer(monkeypatch):
+    """Replace the instance list cache with one driven by a fake clock."""
+    timer = FakeTimer()
+    monkeypatch.setattr(
+        utils,
+        '_instance_list_cache',
+        TTLCache(maxsize=8, ttl=utils.INSTANCE_LIST_CACHE_TTL, timer=timer),
+    )
+    return timer
+
+
+def test_instance_list_cache_hit_within_ttl(instance_list_cache_timer):
+    """Test that a cached instance list is returned until it expires."""
+    client = MagicMock()
+    utils.cache_instance_list(client, 'instances', utils.get_instance_list_generation())
+
+    instance_list_cache_timer.now = utils.INSTANCE_LIST_CACHE_TTL - 1
+    assert utils.get_cached_instance_list(client) == 'instances'
+    assert utils.get_cached_instance_list(MagicMock()) is None
+
+    instance_list_cache_timer.now = utils.INSTANCE_LIST_CACHE_TTL + 1
+    assert utils.get_cached_instance_list(client) is None
+
+
+def test_instance_list_cache_miss_after_clear(instance_list_cache_timer):
+    """Test that clearing the cache drops every cached instance list."""
+    client = MagicMock()
+    utils.cache_instance_list(client, 'instances', utils.get_instance_list_generation())
+
+    utils.clear_instance_list_cache()
+
+    assert utils.get_cached_instance_list(client) is None
+
+
+def test_instance_list_cache_skips_outdated_generation(instance_list_cache_timer):
+    """Test that a list fetched before a clear is not cached after it."""
+    client = MagicMock()
+    generation = utils.get_instance_list_generation()
+
+    utils.clear_instance_list_cache()
+
+    assert utils.cache_instance_list(client, 'instances', generation) is False
+    assert utils.get_cached_instance_list(client) is None
+    assert utils.cache_instance_list(client, 'instances', utils.get_instance_list_generation())
+    assert utils.get_cached_instance_list(client) == 'instances'
+
+
+def test_convert_datetime_to_string_nested():
+    """Test that datetimes in nested dicts and lists are converted in place."""
+    now = datetime.datetime(2024, 1, 2, 3, 4, 5)
+    data = {
+        'time': now,
+        'name': 'test',
+        'nested': {'list': [now, 1, {'date': now.date()}, [now]], 'none': None},
+    }
+
+    result = utils.convert_datetime_to_string(data)
+
+    assert result is data
+    assert result['time'] == now.isoformat()
+    assert result['name'] == 'test'
+    assert result['nested']['list'] == [
+        now.isoformat(),
+        1,
+        {'date': '2024-01-02'},
+        [now.isoformat()],
+    ]
+    assert result['nested']['none'] is None
+
+
+def test_convert_datetime_to_string_scalars():
+    """Test that scalar values are converted or returned unchanged."""
+    now = datetime.datetime(2024, 1, 2, 3, 4, 5)
+
+    assert utils.convert_datetime_to_string(now) == now.isoformat()
+    assert utils.convert_datetime_to_string(None) is None
+    assert utils.convert_datetime_to_string('value') == 'value'
+
+
+def test_format_tags():
+    """Test that tag lists become dicts and incomplete or missing tags are skipped."""
+    tag_list = [
+        {'Key': 'Environment', 'Value': 'Test'},
+        {'Key': 'Empty', 'Value': ''},
+        {'Key': 'NoValue'},
+        {'Value': 'NoKey'},
+    ]
+
+    assert utils.format_tags(tag_list) == {'Environment': 'Test', 'Empty': ''}
+    assert utils.format_tags([]) == {}
+    assert utils.format_tags(None) == {}
+
+
+def test_format_cluster_info_created_time():
+    """Test that the cluster creation time is formatted whether raw or already converted."""
+    now = datetime.datetime(2024, 1, 2, 3, 4, 5)
+
+    assert utils.format_cluster_info({'ClusterCreateTime': now})['created_time'] == now.isoformat()
+    assert (
+        utils.format_cluster_info({'ClusterCreateTime': now.isoformat()})['created_time']
+        == now.isoformat()
+    )
+    assert utils.format_cluster_info({})['created_time'] is None
+
+
+def test_format_instance_info_endpoint():
+    """Test that nested, plain and missing instance endpoints are all formatted."""
+    nested = utils.format_instance_info(
+        {'Endpoint': {'Address': 'db.example.com', 'Port': 5432, 'HostedZoneId': 'Z1'}}
+    )
+    assert nested['endpoint'] == {
+        'address': 'db.example.com',
+        'port': 5432,
+        'hosted_zone_id': 'Z1',
+    }
+
+    assert utils.format_instance_info({'Endpoint': 'db.example.com'})['endpoint'] == {
+        'address': 'db.example.com'
+    }
+    assert utils.format_instance_info({})['endpoint'] == {}
+
+
+def test_handle_paginated_aws_api_call():
+    """Test that items from every page are formatted and collected in order."""
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {'Items': [1, 2]},
+        {},
+        {'Items': [3]},
+    ]
+
+    result = utils.handle_paginated_aws_api_call(
+        client=client,
+        paginator_name='describe_items',
+        operation_parameters={},
+        format_function=lambda item: item * 10,
+        result_key='Items',
+    )
+
+    assert result == [10, 20, 30]
+    client.get_paginator.assert_called_once_with('describe_items')
+
+
+def test_handle_paginated_aws_api_call_does_not_mutate_parameters():
+    """Test that the pagination config is passed without modifying the caller's parameters."""
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = []
+    params = {'DBInstanceIdentifier': 'db-1'}
+
+    utils.handle_paginated_aws_api_call(
+        client=client,
+        paginator_name='describe_db_log_files',
+        operation_parameters=params,
+        format_function=lambda item: item,
+        result_key='DescribeDBLogFiles',
+    )
+
+    assert params == {'DBInstanceIdentifier': 'db-1'}
+    client.get_paginator.return_value.paginate.assert_called_once_with(
+        DBInstanceIdentifier='db-1', PaginationConfig=RDSContext.get_pagination_config()
+    )
+
+
+def test_handle_paginated_aws_api_call_page_size():
+    """Test that a page size is added to a copy of the shared pagination config."""
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = []
+    shared_config = dict(RDSContext.get_pagination_config())
+
+    utils.handle_paginated_aws_api_call(
+        client=client,
+        paginator_name='describe_db_clusters',
+        operation_parameters={},
+        format_function=lambda item: item,
+        result_key='DBClusters',
+        page_size=100,
+    )
+
+    client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={**shared_config, 'PageSize': 100}
+    )
+    assert RDSContext.get_pagination_config() == shared_config
+
+
+def test_handle_paginated_aws_api_call_propagates_errors():
+    """Test that an error raised while fetching a page reaches the caller."""
+
+    def pages():
+        yield {'Items': [1]}
+        raise RuntimeError('throttled')
+
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = pages()
+
+    with pytest.raises(RuntimeError, match='throttled'):
+        utils.handle_paginated_aws_api_call(
+            client=client,
+            paginator_name='describe_items',
+            operation_parameters={},
+            format_function=lambda item: item,
+            result_key='Items',
+        )
+
+
+@pytest.mark.parametrize(
+    'operation,expected',
+    [
+        ('delete_db_proxy', 'critical'),
+        ('modify_db_proxy', 'high'),
+        ('stop_db_instance_automated_backups', 'high'),
+        ('reboot_db_shard_group', 'high'),
+        ('failover_global_cluster', 'high'),
+        ('describe_db_instances', 'low'),
+        ('delete', 'low'),
+        ('deleted_db_thing', 'low'),
+    ],
+)
+def test_get_operation_risk_level_defaults(operation, expected):
+    """Test the default risk level derived from the operation verb."""
+    assert utils.get_operation_risk_level(operation) == expected
+
+
+def test_get_operation_impact_known_and_unknown():
+    """Test impact lookup for known operations and the fallback for unknown ones."""
+    assert (
+        utils.get_operation_impact('delete_db_cluster') is OPERATION_IMPACTS['delete_db_cluster']
+    )
+
+    impact = utils.get_operation_impact('delete_db_proxy')
+    assert impact['risk'] == 'critical'
+    assert impact['downtime'] == 'Unknown'
+
+
+def test_generate_confirmation_token():
+    """Test that confirmation tokens are unique 128-bit hex strings."""
+    token = utils.generate_confirmation_token()
+
+    assert len(token) == 32
+    int(token, 16)
+    assert token != utils.generate_confirmation_token()
+
+
+def test_add_mcp_tags():
+    """Test that MCP tags are appended to existing tags or added when missing."""
+    existing = [{'Key': 'Environment', 'Value': 'Test'}]
+    params = utils.add_mcp_tags({'Tags': existing})
+
+    assert params['Tags'] is existing
+    assert [tag['Key'] for tag in existing] == ['Environment', 'mcp_server_version', 'created_by']
+
+    params = utils.add_mcp_tags({})
+    assert [tag['Key'] for tag in params['Tags']] == ['mcp_server_version', 'created_by']
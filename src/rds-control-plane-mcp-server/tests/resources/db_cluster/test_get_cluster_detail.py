@@ -17,6 +17,7 @@
 import json
 import pytest
 from awslabs.rds_control_plane_mcp_server.resources.db_cluster.get_cluster_detail import (
+    Cluster,
     get_cluster_detail,
 )
 from datetime import datetime
@@ -157,3 +158,45 @@ async def test_get_cluster_detail_client_error():
         assert 'error_code' in result_dict
         assert result_dict['error_code'] == 'DBClusterNotFoundFault'
         assert f'DBCluster {cluster_id} not found' in result_dict['error_message']
+
+
+def test_cluster_from_db_cluster_type_def():
+    """Test conversion of a raw DB cluster into the Cluster model."""
+    create_time = datetime(2023, 1, 1, 12, 0, 0)
+    cluster = Cluster.from_DBClusterTypeDef(
+        {
+            'DBClusterIdentifier': 'test-cluster-1',
+            'Status': 'available',
+            'Engine': 'aurora-mysql',
+            'MultiAZ': True,
+            'ClusterCreateTime': create_time,
+            'BackupRetentionPeriod': 7,
+            'DBClusterMembers': [
+                {'DBInstanceIdentifier': 'test-instance-1', 'IsClusterWriter': True},
+            ],
+            'VpcSecurityGroups': [{'VpcSecurityGroupId': 'sg-12345', 'Status': 'active'}],
+            'TagList': [{'Key': 'Environment', 'Value': 'Production'}, {'Key': 'NoValue'}],
+        }  # type: ignore
+    )
+
+    assert cluster.cluster_id == 'test-cluster-1'
+    assert cluster.engine_version is None
+    assert cluster.created_time == create_time
+    assert cluster.members[0].instance_id == 'test-instance-1'
+    assert cluster.members[0].is_writer is True
+    assert cluster.members[0].status is None
+    assert cluster.vpc_security_groups == [{'id': 'sg-12345', 'status': 'active'}]
+    assert cluster.tags == {'Environment': 'Production'}
+    assert cluster.resource_uri == 'aws-rds://db-cluster/test-cluster-1'
+
+
+def test_cluster_from_db_cluster_type_def_minimal():
+    """Test that a cluster with no optional fields falls back to defaults."""
+    cluster = Cluster.from_DBClusterTypeDef({})  # type: ignore
+
+    assert cluster.cluster_id == ''
+    assert cluster.multi_az is False
+    assert cluster.backup_retention == 0
+    assert cluster.members == []
+    assert cluster.vpc_security_groups == []
+    assert cluster.tags == {}
@@ -18,8 +18,12 @@ import json
 import pytest
 from unittest.mock import MagicMock, patch
 
-from awslabs.rds_control_plane_mcp_server.resources.db_instance.list_db_logs import list_db_log_files
+from awslabs.rds_control_plane_mcp_server.resources.db_instance.list_db_logs import (
+    list_db_log_files,
+    list_db_log_files_by_name,
+)
 from awslabs.rds_control_plane_mcp_server.common.connection import RDSConnectionManager
+from awslabs.rds_control_plane_mcp_server.common.server import mcp
 
 
 @pytest.mark.asyncio
@@ -125,3 +129,58 @@ async def test_list_db_logs_general_error(mock_rds_client):
     assert 'error' in result_dict
     assert 'error_type' in result_dict
     assert result_dict['error_type'] == 'ValueError'
+
+
+@pytest.mark.asyncio
+async def test_list_db_logs_by_name_filters_server_side(mock_rds_client):
+    """Test that the file name filter is passed to the RDS API."""
+    paginator_mock = MagicMock()
+    paginator_mock.paginate.return_value = [{
+        'DescribeDBLogFiles': [
+            {'LogFileName': 'error/mysql-error.log', 'LastWritten': 1625097600000, 'Size': 1024}
+        ]
+    }]
+    mock_rds_client.get_paginator.return_value = paginator_mock
+
+    with patch.object(RDSConnectionManager, 'get_connection', return_value=mock_rds_client):
+        result = await list_db_log_files_by_name(
+            db_instance_identifier='test-instance-1', filename_contains='error'
+        )
+
+    call_kwargs = paginator_mock.paginate.call_args.kwargs
+    assert call_kwargs['DBInstanceIdentifier'] == 'test-instance-1'
+    assert call_kwargs['FilenameContains'] == 'error'
+    assert call_kwargs['FileSize'] == 1
+
+    assert result.count == 1
+    assert result.log_files[0].log_file_name == 'error/mysql-error.log'
+    assert result.resource_uri == 'aws-rds://db-instance/test-instance-1/log/error'
+
+
+@pytest.mark.asyncio
+async def test_list_db_logs_resource_uri(mock_rds_client):
+    """Test that the resource URI contains the requested instance identifier."""
+    paginator_mock = MagicMock()
+    paginator_mock.paginate.return_value = [{'DescribeDBLogFiles': []}]
+    mock_rds_client.get_paginator.return_value = paginator_mock
+
+    with patch.object(RDSConnectionManager, 'get_connection', return_value=mock_rds_client):
+        result = await list_db_log_files(db_instance_identifier='test-instance-1')
+
+    assert result.resource_uri == 'aws-rds://db-instance/test-instance-1/log'
+
+
+
+@pytest.mark.asyncio
+async def test_list_db_logs_by_name_decodes_filter(mock_rds_client):
+    """Test that a percent-encoded filter is decoded when read through the MCP server."""
+    paginator_mock = MagicMock()
+    paginator_mock.paginate.return_value = [{'DescribeDBLogFiles': []}]
+    mock_rds_client.get_paginator.return_value = paginator_mock
+
+    with patch.object(RDSConnectionManager, 'get_connection', return_value=mock_rds_client):
+        contents = await mcp.read_resource('aws-rds://db-instance/test-instance-1/log/slow%20query')
+
+    result_dict = json.loads(contents[0].content)
+    assert paginator_mock.paginate.call_args.kwargs['FilenameContains'] == 'slow query'
+    assert result_dict['resource_uri'] == 'aws-rds://db-instance/test-instance-1/log/slow%20query'
@@ -0,0 +1,115 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the instance list cache used by the list_instances resource."""
+
+import pytest
+from awslabs.rds_control_plane_mcp_server.common import utils
+from awslabs.rds_control_plane_mcp_server.common.connection import RDSConnectionManager
+from awslabs.rds_control_plane_mcp_server.resources.db_instance.list_instances import (
+    LIST_INSTANCES_RESOURCE_DESCRIPTION,
+    InstanceSummaryList,
+    list_instances,
+)
+from botocore.exceptions import ClientError
+from cachetools import TTLCache
+from unittest.mock import MagicMock, patch
+
+
+@pytest.fixture(autouse=True)
+def instance_list_cache(monkeypatch):
+    """Give each test an empty instance list cache."""
+    monkeypatch.setattr(
+        utils, '_instance_list_cache', TTLCache(maxsize=8, ttl=utils.INSTANCE_LIST_CACHE_TTL)
+    )
+
+
+@pytest.fixture
+def rds_client():
+    """Create an RDS client whose paginator returns a single instance."""
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {'DBInstances': [{'DBInstanceIdentifier': 'test-instance-1'}]}
+    ]
+    return client
+
+
+async def test_list_instances_reuses_cached_result(rds_client):
+    """Test that a second read within the TTL does not call the RDS API again."""
+    with patch.object(RDSConnectionManager, 'get_connection', return_value=rds_client):
+        first = await list_instances()
+        second = await list_instances()
+
+    assert isinstance(first, InstanceSummaryList)
+    assert second is first
+    assert rds_client.get_paginator.return_value.paginate.call_count == 1
+
+
+async def test_list_instances_refetches_after_clear(rds_client):
+    """Test that clearing the cache makes the next read call the RDS API."""
+    with patch.object(RDSConnectionManager, 'get_connection', return_value=rds_client):
+        await list_instances()
+        utils.clear_instance_list_cache()
+        await list_instances()
+
+    assert rds_client.get_paginator.return_value.paginate.call_count == 2
+
+
+async def test_list_instances_does_not_cache_errors(rds_client):
+    """Test that a failed read is not served from the cache afterwards."""
+    paginate = rds_client.get_paginator.return_value.paginate
+    paginate.side_effect = [
+        ClientError({'Error': {'Code': 'Throttling', 'Message': 'Rate exceeded'}}, 'Describe'),
+        [{'DBInstances': [{'DBInstanceIdentifier': 'test-instance-1'}]}],
+    ]
+
+    with patch.object(RDSConnectionManager, 'get_connection', return_value=rds_client):
+        failed = await list_instances()
+        assert utils.get_cached_instance_list(rds_client) is None
+        result = await list_instances()
+
+    assert isinstance(failed, str)
+    assert isinstance(result, InstanceSummaryList)
+    assert result.count == 1
+    assert paginate.call_count == 2
+
+
+async def test_list_instances_does_not_cache_across_clear(rds_client):
+    """Test that a list fetched while the cache is cleared is not cached."""
+    page = [{'DBInstances': [{'DBInstanceIdentifier': 'test-instance-1'}]}]
+
+    def paginate_during_change(**kwargs):
+        # a mutating tool finishes while this fetch is still in flight
+        utils.clear_instance_list_cache()
+        return page
+
+    paginate = rds_client.get_paginator.return_value.paginate
+    paginate.side_effect = paginate_during_change
+
+    with patch.object(RDSConnectionManager, 'get_connection', return_value=rds_client):
+        result = await list_instances()
+        assert utils.get_cached_instance_list(rds_client) is None
+
+        paginate.side_effect = None
+        paginate.return_value = page
+        await list_instances()
+
+    assert isinstance(result, InstanceSummaryList)
+    assert paginate.call_count == 2
+
+
+def test_list_instances_description_uses_cache_ttl():
+    """Test that the documented cache duration follows the configured TTL."""
+    assert f'up to {utils.INSTANCE_LIST_CACHE_TTL} seconds' in LIST_INSTANCES_RESOURCE_DESCRIPTION
+    assert '`aws-rds://db-instance/{instance_id}`' in LIST_INSTANCES_RESOURCE_DESCRIPTION
@@ -0,0 +1,49 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the context module in the RDS Control Plane MCP Server."""
+
+import pytest
+from awslabs.rds_control_plane_mcp_server.context import RDSContext
+
+
+def test_pagination_config_follows_initialize():
+    """Test that the cached pagination config is rebuilt when the context is initialized."""
+    try:
+        RDSContext.initialize(readonly=True, max_items=25)
+        config = RDSContext.get_pagination_config()
+
+        assert config == {'MaxItems': 25}
+        assert RDSContext.get_pagination_config() is config
+
+        RDSContext.initialize(readonly=True, max_items=50)
+        assert RDSContext.get_pagination_config() == {'MaxItems': 50}
+    finally:
+        RDSContext.initialize()
+
+
+def test_pagination_config_default_follows_max_items():
+    """Test that the default pagination config uses the default item limit."""
+    RDSContext.initialize()
+    assert RDSContext.get_pagination_config() == {'MaxItems': RDSContext.max_items()}
+
+
+def test_pagination_config_is_read_only():
+    """Test that callers cannot modify the shared pagination config."""
+    config = RDSContext.get_pagination_config()
+
+    with pytest.raises(TypeError):
+        config['MaxItems'] = 1  # type: ignore[index]
+
+    assert RDSContext.get_pagination_config()['MaxItems'] == RDSContext.max_items()
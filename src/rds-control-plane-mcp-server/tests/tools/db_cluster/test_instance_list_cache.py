@@ -0,0 +1,97 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests that the DB cluster tools invalidate the cached instance list."""
+
+import pytest
+from awslabs.rds_control_plane_mcp_server.common import utils
+from awslabs.rds_control_plane_mcp_server.common.connection import RDSConnectionManager
+from awslabs.rds_control_plane_mcp_server.constants import (
+    CONFIRM_FAILOVER,
+    CONFIRM_START,
+    CONFIRM_STOP,
+)
+from awslabs.rds_control_plane_mcp_server.context import RDSContext
+from awslabs.rds_control_plane_mcp_server.tools.db_cluster.delete_cluster import (
+    delete_db_cluster,
+)
+from awslabs.rds_control_plane_mcp_server.tools.db_cluster.failover_cluster import (
+    failover_db_cluster,
+)
+from awslabs.rds_control_plane_mcp_server.tools.db_cluster.modify_cluster import (
+    modify_db_cluster,
+)
+from awslabs.rds_control_plane_mcp_server.tools.db_cluster.status_cluster import (
+    status_db_cluster,
+)
+from cachetools import TTLCache
+from unittest.mock import MagicMock, patch
+
+
+async def _delete_with_token(db_cluster_identifier):
+    """Request a deletion token, then confirm the deletion with it."""
+    pending = await delete_db_cluster(
+        db_cluster_identifier=db_cluster_identifier, skip_final_snapshot=True
+    )
+    return await delete_db_cluster(
+        db_cluster_identifier=db_cluster_identifier,
+        skip_final_snapshot=True,
+        confirmation_token=pending['confirmation_token'],
+    )
+
+
+@pytest.mark.parametrize(
+    'run_tool',
+    [
+        pytest.param(
+            lambda cluster: status_db_cluster(
+                db_cluster_identifier=cluster, action='start', confirmation=CONFIRM_START
+            ),
+            id='start',
+        ),
+        pytest.param(
+            lambda cluster: status_db_cluster(
+                db_cluster_identifier=cluster, action='stop', confirmation=CONFIRM_STOP
+            ),
+            id='stop',
+        ),
+        pytest.param(
+            lambda cluster: failover_db_cluster(
+                db_cluster_identifier=cluster, confirmation=CONFIRM_FAILOVER
+            ),
+            id='failover',
+        ),
+        pytest.param(
+            lambda cluster: modify_db_cluster(db_cluster_identifier=cluster, port=3307),
+            id='modify',
+        ),
+        pytest.param(_delete_with_token, id='delete'),
+    ],
+)
+async def test_cluster_tools_clear_instance_list_cache(run_tool, monkeypatch):
+    """Test that a successful cluster change drops the cached instance list."""
+    monkeypatch.setattr(
+        utils, '_instance_list_cache', TTLCache(maxsize=8, ttl=utils.INSTANCE_LIST_CACHE_TTL)
+    )
+    rds_client = MagicMock()
+    utils.cache_instance_list(rds_client, 'stale instances', utils.get_instance_list_generation())
+
+    with (
+        patch.object(RDSConnectionManager, 'get_connection', return_value=rds_client),
+        patch.object(RDSContext, 'check_operation_allowed', return_value=True),
+    ):
+        result = await run_tool('test-cluster')
+
+    assert 'error' not in result
+    assert utils.get_cached_instance_list(rds_client) is None
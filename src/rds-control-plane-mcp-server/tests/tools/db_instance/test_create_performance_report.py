@@ -0,0 +1,138 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the create_performance_report tool."""
+
+import json
+import pytest
+from awslabs.rds_control_plane_mcp_server.common.connection import PIConnectionManager
+from awslabs.rds_control_plane_mcp_server.context import RDSContext
+from awslabs.rds_control_plane_mcp_server.tools.db_instance.create_performance_report import (
+    REPORT_CREATION_SUCCESS_RESPONSE,
+    _parse_iso_datetime,
+    create_performance_report,
+)
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+
+@pytest.fixture
+def pi_client(mock_pi_client):
+    """Patch the PI connection and allow write operations."""
+    mock_pi_client.create_performance_analysis_report.return_value = {
+        'AnalysisReportId': 'report-123'
+    }
+    _parse_iso_datetime.cache_clear()
+    with (
+        patch.object(RDSContext, 'readonly_mode', return_value=False),
+        patch.object(PIConnectionManager, 'get_connection', return_value=mock_pi_client),
+    ):
+        yield mock_pi_client
+
+
+def _report_call_kwargs(pi_client):
+    """Return the keyword arguments of the last report creation call."""
+    return pi_client.create_performance_analysis_report.call_args.kwargs
+
+
+async def test_create_performance_report_message(pi_client):
+    """Test that the returned message fills in the report and instance identifiers."""
+    result = await create_performance_report(
+        dbi_resource_identifier='db-EXAMPLE',
+        start_time='2025-06-01T00:00:00Z',
+        end_time='2025-06-01T01:00:00Z',
+    )
+
+    assert result == REPORT_CREATION_SUCCESS_RESPONSE.format('report-123', 'db-EXAMPLE')
+
+
+async def test_create_performance_report_start_time_only(pi_client):
+    """Test that a Z suffixed start time is compared against the aware default end time."""
+    start = (datetime.now(timezone.utc) - timedelta(days=3)).replace(microsecond=0)
+
+    await create_performance_report(
+        dbi_resource_identifier='db-EXAMPLE',
+        start_time=start.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        end_time=None,
+    )
+
+    kwargs = _report_call_kwargs(pi_client)
+    assert kwargs['StartTime'] == start
+    assert kwargs['StartTime'].tzinfo is not None
+    assert kwargs['EndTime'].tzinfo is not None
+    assert kwargs['EndTime'] - start == pytest.approx(timedelta(days=1), abs=timedelta(minutes=1))
+
+
+async def test_create_performance_report_naive_times_are_utc(pi_client):
+    """Test that times without an offset are taken to be UTC."""
+    await create_performance_report(
+        dbi_resource_identifier='db-EXAMPLE',
+        start_time='2025-06-01T00:00:00',
+        end_time='2025-06-01T01:00:00',
+    )
+
+    kwargs = _report_call_kwargs(pi_client)
+    assert kwargs['StartTime'] == datetime(2025, 6, 1, 0, tzinfo=timezone.utc)
+    assert kwargs['EndTime'] == datetime(2025, 6, 1, 1, tzinfo=timezone.utc)
+
+
+async def test_create_performance_report_mixed_offsets(pi_client):
+    """Test that times with different offsets are compared as instants."""
+    # 01:00+02:00 is 23:00 UTC on the previous day, an hour before 00:00Z
+    await create_performance_report(
+        dbi_resource_identifier='db-EXAMPLE',
+        start_time='2025-06-01T01:00:00+02:00',
+        end_time='2025-06-01T00:00:00Z',
+    )
+    kwargs = _report_call_kwargs(pi_client)
+    assert kwargs['EndTime'] - kwargs['StartTime'] == timedelta(hours=1)
+
+    result = await create_performance_report(
+        dbi_resource_identifier='db-EXAMPLE',
+        start_time='2025-06-01T00:00:00Z',
+        end_time='2025-06-01T01:00:00+02:00',
+    )
+    assert json.loads(result)['error_message'] == 'start_time must be before end_time'
+    assert pi_client.create_performance_analysis_report.call_count == 1
+
+
+async def test_create_performance_report_runs_in_thread(pi_client):
+    """Test that the blocking PI call is run off the event loop."""
+    to_thread = AsyncMock(return_value={'AnalysisReportId': 'report-123'})
+
+    with patch('asyncio.to_thread', to_thread):
+        await create_performance_report(
+            dbi_resource_identifier='db-EXAMPLE',
+            start_time='2025-06-01T00:00:00Z',
+            end_time='2025-06-01T01:00:00Z',
+        )
+
+    to_thread.assert_awaited_once()
+    assert to_thread.call_args.args == (pi_client.create_performance_analysis_report,)
+    assert to_thread.call_args.kwargs['Identifier'] == 'db-EXAMPLE'
+    pi_client.create_performance_analysis_report.assert_not_called()
+
+
+async def test_create_performance_report_caches_parsed_times(pi_client):
+    """Test that repeated time strings are parsed once."""
+    for _ in range(2):
+        await create_performance_report(
+            dbi_resource_identifier='db-EXAMPLE',
+            start_time='2025-06-01T00:00:00Z',
+            end_time='2025-06-01T01:00:00Z',
+        )
+
+    cache_info = _parse_iso_datetime.cache_info()
+    assert cache_info.misses == 2
+    assert cache_info.hits == 2
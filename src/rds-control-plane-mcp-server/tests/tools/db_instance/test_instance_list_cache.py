@@ -0,0 +1,45 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests that the DB instance tools invalidate the cached instance list."""
+
+from awslabs.rds_control_plane_mcp_server.common import utils
+from awslabs.rds_control_plane_mcp_server.common.connection import RDSConnectionManager
+from awslabs.rds_control_plane_mcp_server.context import RDSContext
+from awslabs.rds_control_plane_mcp_server.tools.db_instance.modify_instance import (
+    modify_db_instance,
+)
+from cachetools import TTLCache
+from unittest.mock import MagicMock, patch
+
+
+async def test_modify_instance_clears_instance_list_cache(monkeypatch):
+    """Test that a successful instance change drops the cached instance list."""
+    monkeypatch.setattr(
+        utils, '_instance_list_cache', TTLCache(maxsize=8, ttl=utils.INSTANCE_LIST_CACHE_TTL)
+    )
+    rds_client = MagicMock()
+    utils.cache_instance_list(rds_client, 'stale instances', utils.get_instance_list_generation())
+
+    with (
+        patch.object(RDSConnectionManager, 'get_connection', return_value=rds_client),
+        patch.object(RDSContext, 'check_operation_allowed', return_value=True),
+    ):
+        result = await modify_db_instance(
+            db_instance_identifier='test-instance-1', allocated_storage=200
+        )
+
+    assert 'error' not in result
+    rds_client.modify_db_instance.assert_called_once()
+    assert utils.get_cached_instance_list(rds_client) is None
@@ -0,0 +1,68 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the describe_rds_performance_metrics tool."""
+
+from awslabs.rds_control_plane_mcp_server.common.connection import CloudwatchConnectionManager
+from awslabs.rds_control_plane_mcp_server.context import RDSContext
+from awslabs.rds_control_plane_mcp_server.tools.general.describe_rds_performance_metrics import (
+    MetricSummaryList,
+    describe_rds_performance_metrics,
+)
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+
+async def test_describe_rds_performance_metrics_paginates():
+    """Test that metric data is fetched through the paginated helper and summarized."""
+    cloudwatch_client = MagicMock()
+    paginator = cloudwatch_client.get_paginator.return_value
+    paginator.paginate.return_value = [
+        {
+            'MetricDataResults': [
+                {
+                    'Id': 'metric_CPUUtilization_Average',
+                    'Label': 'CPUUtilization',
+                    'StatusCode': 'Complete',
+                    'Timestamps': [datetime(2025, 6, 1, 1), datetime(2025, 6, 1, 0)],
+                    'Values': [20.0, 10.0],
+                }
+            ]
+        }
+    ]
+
+    with patch.object(
+        CloudwatchConnectionManager, 'get_connection', return_value=cloudwatch_client
+    ):
+        result = await describe_rds_performance_metrics(
+            resource_identifier='test-instance',
+            resource_type='INSTANCE',
+            start_date='2025-06-01T00:00:00Z',
+            end_date='2025-06-01T01:00:00Z',
+            period=60,
+            stat='Average',
+            scan_by='TimestampDescending',
+        )
+
+    assert isinstance(result, MetricSummaryList)
+    assert [metric.id for metric in result.metrics] == ['metric_CPUUtilization_Average']
+    assert result.metrics[0].current_value == 20.0
+    assert result.metrics[0].trend == 'increasing'
+
+    cloudwatch_client.get_paginator.assert_called_once_with('get_metric_data')
+    kwargs = paginator.paginate.call_args.kwargs
+    assert kwargs['PaginationConfig'] == RDSContext.get_pagination_config()
+    assert kwargs['StartTime'] == datetime(2025, 6, 1, tzinfo=timezone.utc)
+    assert kwargs['ScanBy'] == 'TimestampDescending'
+    assert len(kwargs['MetricDataQueries']) == 6